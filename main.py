@@ -1,25 +1,42 @@
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Optional, List
+from typing import Any, AsyncIterator, Callable, Dict, FrozenSet, Iterable, Optional, List, Tuple
+import asyncio
+import functools
 import hashlib
 import re
+import sys
 from datetime import datetime
-import json
+import orjson
 import os
 from urllib.parse import unquote_plus
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from dataclasses import dataclass, field
+import numpy as np
 
-app = FastAPI(title="String Analysis API")
+try:
+    import blake3
+except ImportError:  # optional; only needed for HASH_ALGO=blake3
+    blake3 = None
+
+app = FastAPI(title="String Analysis API", default_response_class=ORJSONResponse)
 
 # ----- Pydantic models -----
 class CreateRequest(BaseModel):
     value: str
 
+class BatchCreateRequest(BaseModel):
+    values: List[str]
+
 class Properties(BaseModel):
     length: int
     is_palindrome: bool
     unique_characters: int
     word_count: int
-    sha256_hash: str
+    content_hash: str
+    hash_algorithm: str
     character_frequency_map: Dict[str, int]
 
 class StoredString(BaseModel):
@@ -28,63 +45,354 @@ class StoredString(BaseModel):
     properties: Properties
     created_at: str
 
+# ----- Storage rows -----
+# Pydantic models describe the API; stored records are kept as flat, slotted
+# rows instead, so filter loops do one slot load per property rather than
+# going through two models.
+@dataclass(slots=True, frozen=True)
+class StoredRow:
+    id: str
+    value: str
+    length: int
+    is_palindrome: bool
+    unique_characters: int
+    word_count: int
+    content_hash: str
+    hash_algorithm: str
+    character_frequency_map: Dict[str, int]
+    created_at: str
+    # distinct characters, derived from the frequency map; membership tests
+    # for contains_character only need this, not the counts
+    char_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "char_set", frozenset(self.character_frequency_map))
+
+    def to_dict(self) -> dict:
+        # same shape as StoredString
+        return {
+            "id": self.id,
+            "value": self.value,
+            "properties": {
+                "length": self.length,
+                "is_palindrome": self.is_palindrome,
+                "unique_characters": self.unique_characters,
+                "word_count": self.word_count,
+                "content_hash": self.content_hash,
+                "hash_algorithm": self.hash_algorithm,
+                "character_frequency_map": self.character_frequency_map,
+            },
+            "created_at": self.created_at,
+        }
+
 # ----- In-memory DB + persistence -----
-string_db: Dict[str, StoredString] = {}
+# The db is persisted as a snapshot (DB_FILE) plus an append-only log of
+# mutations (WAL_FILE). Each mutation appends one line; the snapshot is only
+# rewritten periodically, after which the log is truncated.
+string_db: Dict[str, StoredRow] = {}
+# value -> id, so lookups and duplicate checks by value are O(1)
+value_index: Dict[str, str] = {}
+# id -> serialized record, built once at insert and reused by every read;
+# wrapped in orjson.Fragment so it can be embedded in larger documents as-is
+string_payloads: Dict[str, orjson.Fragment] = {}
 DB_FILE = "string_db.json"
+WAL_FILE = DB_FILE + ".wal"
+# fsync each log write; survives power loss at a large throughput cost
+WAL_FSYNC = False
+# fold the log into a new snapshot after this many ops, or this many seconds
+SNAPSHOT_EVERY_OPS = 1000
+SNAPSHOT_INTERVAL = 60
+
+class PropertyColumns:
+    # Numeric/bool properties stored column-wise (one numpy array per property)
+    # so those filters run as vectorized masks instead of per-record attribute
+    # lookups. Position i of the arrays describes rows[i]; positions are in
+    # insertion order, and a deleted row stays as a tombstone (None) until the
+    # next compaction.
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.rows: List[Optional[StoredRow]] = []
+        self.row_of: Dict[str, int] = {}
+        self.dead = 0
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.is_palindrome = np.zeros(capacity, dtype=bool)
+        self.length = np.zeros(capacity, dtype=np.int64)
+        self.word_count = np.zeros(capacity, dtype=np.int64)
+
+    def _columns(self) -> Tuple[str, ...]:
+        return ("alive", "is_palindrome", "length", "word_count")
+
+    def _resize(self, capacity: int, rows: Optional[np.ndarray] = None) -> None:
+        # copy into fresh arrays, keeping only `rows` when given
+        for name in self._columns():
+            old = getattr(self, name)
+            kept = old[rows] if rows is not None else old[:len(self.rows)]
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(kept)] = kept
+            setattr(self, name, new)
+
+    def put(self, stored: StoredRow) -> None:
+        row = self.row_of.get(stored.id)
+        if row is None:
+            row = len(self.rows)
+            if row == len(self.alive):
+                # double on full, so appends stay amortized O(1)
+                self._resize(2 * row)
+            self.rows.append(stored)
+            self.row_of[stored.id] = row
+        else:
+            self.rows[row] = stored
+        self.alive[row] = True
+        self.is_palindrome[row] = stored.is_palindrome
+        self.length[row] = stored.length
+        self.word_count[row] = stored.word_count
+
+    def remove(self, sid: str) -> None:
+        row = self.row_of.pop(sid)
+        self.rows[row] = None
+        self.alive[row] = False
+        self.dead += 1
+        if self.dead > 1024 and 2 * self.dead > len(self.rows):
+            self._compact()
+
+    def _compact(self) -> None:
+        # drop tombstones; surviving rows keep their relative order
+        keep = np.flatnonzero(self.alive[:len(self.rows)])
+        self._resize(len(self.alive), keep)
+        self.rows = [self.rows[i] for i in keep.tolist()]
+        self.row_of = {stored.id: row for row, stored in enumerate(self.rows)}
+        self.dead = 0
+
+    def scan(self, filters: Dict[str, Any]) -> List[StoredRow]:
+        # live rows matching filters, in insertion order; only COLUMN_FILTERS
+        # are vectorized, contains_character is checked on the surviving rows
+        n = len(self.rows)
+        mask = self.alive[:n].copy()
+        if filters.get("is_palindrome") is not None:
+            mask &= self.is_palindrome[:n] == filters["is_palindrome"]
+        if filters.get("min_length") is not None:
+            mask &= self.length[:n] >= filters["min_length"]
+        if filters.get("max_length") is not None:
+            mask &= self.length[:n] <= filters["max_length"]
+        if filters.get("word_count") is not None:
+            mask &= self.word_count[:n] == filters["word_count"]
+        if filters.get("min_word_count") is not None:
+            mask &= self.word_count[:n] >= filters["min_word_count"]
+        rows = self.rows
+        hits = np.flatnonzero(mask).tolist()
+        if filters.get("contains_character") is None:
+            return [rows[i] for i in hits]
+        ch = filters["contains_character"].lower()
+        return [st for i in hits if ch in (st := rows[i]).char_set]
+
+property_columns = PropertyColumns()
+
+def db_put(stored: StoredRow) -> None:
+    # all writes to string_db go through db_put/db_pop to keep the indexes in step
+    previous = string_db.get(stored.id)
+    if previous is not None:
+        value_index.pop(previous.value, None)
+    string_db[stored.id] = stored
+    string_payloads[stored.id] = orjson.Fragment(orjson.dumps(stored.to_dict()))
+    value_index[stored.value] = stored.id
+    # an existing id is overwritten in place, keeping its row
+    property_columns.put(stored)
+
+def db_pop(key: str) -> Optional[StoredRow]:
+    stored = string_db.pop(key, None)
+    if stored is not None:
+        value_index.pop(stored.value, None)
+        del string_payloads[key]
+        property_columns.remove(key)
+    return stored
 
-def save_db() -> None:
+def put_record(stored: StoredRow) -> dict:
+    return {"op": "put", "k": stored.id, "v": string_payloads[stored.id]}
+
+def delete_record(key: str) -> dict:
+    return {"op": "del", "k": key}
+
+def _fsync_dir(path: str) -> None:
+    # makes a rename in `path` durable; directories cannot be opened on Windows
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def save_db(payloads: Optional[Dict[str, orjson.Fragment]] = None) -> None:
+    if payloads is None:
+        payloads = string_payloads
+    tmp_file = DB_FILE + ".tmp"
     try:
-        with open(DB_FILE, "w", encoding="utf-8") as f:
-            # store Pydantic dicts
-            json.dump({k: v.dict() for k, v in string_db.items()}, f, indent=2, ensure_ascii=False)
+        with open(tmp_file, "wb") as f:
+            # cached record payloads are spliced in without re-serializing
+            f.write(orjson.dumps(payloads))
+            # the snapshot must be on disk before the log it replaces is truncated
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, DB_FILE)
+        if WAL_FSYNC:
+            _fsync_dir(os.path.dirname(os.path.abspath(DB_FILE)))
+        # everything in the log is now part of the snapshot
+        wal = getattr(app.state, "wal", None)
+        if wal is not None:
+            wal.truncate(0)
+        app.state.wal_ops = 0
     except Exception:
         # avoid crashing on save failure; log in real app
         pass
 
-def load_db() -> None:
-    if not os.path.exists(DB_FILE):
-        return
+def wal_write(records: List[dict]) -> None:
     try:
-        with open(DB_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            for k, v in data.items():
-                string_db[k] = StoredString(**v)
+        wal = app.state.wal
+        wal.write(b"".join(orjson.dumps(r) + b"\n" for r in records))
+        wal.flush()
+        if WAL_FSYNC:
+            os.fsync(wal.fileno())
     except Exception:
-        # ignore malformed DB for now
+        # avoid crashing on save failure; log in real app
         pass
+    app.state.wal_ops += len(records)
+
+def persist(records: List[dict]) -> None:
+    # hand records to persist_writer; the request never waits on disk
+    app.state.persist_queue.put_nowait(records)
+
+def row_from_dict(data: dict) -> StoredRow:
+    # we wrote these records ourselves, so no validation on reload
+    props = data["properties"]
+    if "sha256_hash" in props:
+        # written before content_hash existed; the old hash stays as an opaque id
+        props = {k: v for k, v in props.items() if k != "sha256_hash"}
+        props["content_hash"] = data["properties"]["sha256_hash"]
+        props["hash_algorithm"] = "sha256"
+    return StoredRow(id=data["id"], value=data["value"], created_at=data["created_at"], **props)
+
+def load_db() -> None:
+    if os.path.exists(DB_FILE):
+        try:
+            with open(DB_FILE, "rb") as f:
+                data = orjson.loads(f.read())
+                for k, v in data.items():
+                    db_put(row_from_dict(v))
+        except Exception as exc:
+            # refuse to start: startup would otherwise snapshot the partial db
+            # over this file and truncate the log, losing both for good
+            raise RuntimeError(
+                f"Cannot load snapshot {DB_FILE!r} ({exc}); repair it or move it aside before starting"
+            ) from exc
+
+    if os.path.exists(WAL_FILE):
+        # replay mutations made since the snapshot, in order
+        with open(WAL_FILE, "rb") as f:
+            for line in f:
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # torn final write from a crash; nothing after it is valid
+                    break
+                if record["op"] == "put":
+                    db_put(row_from_dict(record["v"]))
+                else:
+                    db_pop(record["k"])
+
+async def persist_writer() -> None:
+    # sole owner of the log and snapshot files while the app is running
+    queue: asyncio.Queue = app.state.persist_queue
+    loop = asyncio.get_running_loop()
+    last_snapshot = loop.time()
+    stopping = False
+    while not stopping:
+        timeout = max(0.0, SNAPSHOT_INTERVAL - (loop.time() - last_snapshot))
+        try:
+            batches = [await asyncio.wait_for(queue.get(), timeout)]
+        except asyncio.TimeoutError:
+            batches = []
+        # coalesce everything queued during a burst into one write
+        while not queue.empty():
+            batches.append(queue.get_nowait())
+        stopping = None in batches
+        records = [r for batch in batches if batch is not None for r in batch]
+        if records:
+            await asyncio.to_thread(wal_write, records)
+
+        due = loop.time() - last_snapshot >= SNAPSHOT_INTERVAL
+        if app.state.wal_ops >= SNAPSHOT_EVERY_OPS or (due and app.state.wal_ops):
+            # copy on the loop thread so handlers can keep mutating string_db
+            await asyncio.to_thread(save_db, dict(string_payloads))
+            last_snapshot = loop.time()
+        elif due:
+            last_snapshot = loop.time()
 
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     load_db()
+    app.state.wal = open(WAL_FILE, "ab")
+    app.state.wal_ops = 0
+    # fold any replayed log into a fresh snapshot before serving
+    save_db()
+    app.state.persist_queue = asyncio.Queue()
+    app.state.persist_task = asyncio.create_task(persist_writer())
 
 @app.on_event("shutdown")
-def on_shutdown():
+async def on_shutdown():
+    # let the writer drain what is queued, then take a final snapshot
+    app.state.persist_queue.put_nowait(None)
+    await app.state.persist_task
     save_db()
+    app.state.wal.close()
 
 # ----- Utilities -----
+# hashlib (and blake3) only release the GIL while hashing inputs of at least
+# 2 KiB; smaller values gain nothing from another thread
+HASH_GIL_MIN_BYTES = 2048
+# a batch goes to the pool only when its large values add up to this much
+BATCH_HASH_MIN_BYTES = 256 * 1024
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
 def generate_sha_256(data: str) -> str:
-    sha_256 = hashlib.sha256()
-    sha_256.update(data.encode("utf-8"))
-    return sha_256.hexdigest()
+    # one-shot constructor; hashlib's OpenSSL backend dispatches to SHA-NI when the CPU has it
+    return hashlib.sha256(data.encode("utf-8")).digest().hex()
+
+def generate_blake3(data: str) -> str:
+    # BLAKE3 vectorizes internally (SSE4.1/AVX2/AVX-512), even for a single input
+    return blake3.blake3(data.encode("utf-8")).hexdigest(length=32)
+
+# The hash only content-addresses records (ids), so any collision-resistant
+# function works. Set HASH_ALGO=blake3 to opt in; existing ids stay valid.
+HASH_FUNCS = {"sha256": generate_sha_256, "blake3": generate_blake3}
+HASH_ALGO = os.getenv("HASH_ALGO", "sha256").lower()
+if HASH_ALGO not in HASH_FUNCS:
+    raise RuntimeError(f"Unsupported HASH_ALGO {HASH_ALGO!r}; expected one of {sorted(HASH_FUNCS)}")
+if HASH_ALGO == "blake3" and blake3 is None:
+    raise RuntimeError("HASH_ALGO=blake3 requires the 'blake3' package")
+generate_content_hash = HASH_FUNCS[HASH_ALGO]
+
+_NON_WORD_RE = re.compile(r'[\W_]+')
+_LONGER_THAN_RE = re.compile(r"longer than (\d+)")
+_CONTAINS_RE = re.compile(r"contain(?:s|ing)?(?: the letter)?\s+([a-zA-Z])")
+
+# deletes every ASCII character that is not a letter or digit
+_ASCII_CLEAN_TABLE = str.maketrans("", "", "".join(chr(c) for c in range(128) if not chr(c).isalnum()))
 
 def clean_for_char_ops(data: str) -> str:
     # remove non-word chars and underscores, make lowercase
-    return re.sub(r'[\W_]+', '', data.lower())
+    if data.isascii():
+        # single C pass over a lookup table; no regex engine needed
+        return data.lower().translate(_ASCII_CLEAN_TABLE)
+    return _NON_WORD_RE.sub('', data.lower())
 
-def palindrome(data: str) -> bool:
-    clean_data = clean_for_char_ops(data)
-    return clean_data == clean_data[::-1]
+# the helpers below take the output of clean_for_char_ops, so callers clean once
 
-def char_count(data: str) -> Dict[str, int]:
-    chars: Dict[str, int] = {}
-    clean_data = clean_for_char_ops(data)
-    for ch in clean_data:
-        chars[ch] = chars.get(ch, 0) + 1
-    return chars
+def palindrome_cleaned(clean_data: str) -> bool:
+    return clean_data == clean_data[::-1]
 
-def unique_characters_count(data: str) -> int:
-    # distinct characters (case-insensitive; non-word filtered)
-    return len(char_count(data).keys())
+def char_count_cleaned(clean_data: str) -> Dict[str, int]:
+    # Counter counts in C; keys stay in first-seen order like the old loop
+    return dict(Counter(clean_data))
 
 def word_count(data: str) -> int:
     # words separated by whitespace
@@ -92,13 +400,135 @@ def word_count(data: str) -> int:
         return 0
     return len(data.split())
 
+# (length, is_palindrome, unique_characters, word_count, character_frequency_map)
+ComputedProperties = Tuple[int, bool, int, int, Dict[str, int]]
+
+def compute_properties(value: str) -> ComputedProperties:
+    cleaned = clean_for_char_ops(value)
+    freq = char_count_cleaned(cleaned)
+    return (
+        len(value),
+        palindrome_cleaned(cleaned),
+        # distinct characters (case-insensitive; non-word filtered)
+        len(freq),
+        word_count(value),
+        freq,
+    )
+
+async def generate_content_hash_batch(values: List[str]) -> List[str]:
+    # len() in characters is a lower bound on the UTF-8 size
+    large = [i for i, v in enumerate(values) if len(v) >= HASH_GIL_MIN_BYTES]
+    if sum(len(values[i]) for i in large) < BATCH_HASH_MIN_BYTES:
+        return [generate_content_hash(v) for v in values]
+    # large values hash in parallel on the pool while the loop stays free;
+    # small ones are cheaper inline than a thread handoff
+    loop = asyncio.get_running_loop()
+    pending = {i: loop.run_in_executor(_hash_executor, generate_content_hash, values[i]) for i in large}
+    hashes = ["" if i in pending else generate_content_hash(v) for i, v in enumerate(values)]
+    for i, future in pending.items():
+        hashes[i] = await future
+    return hashes
+
+def build_stored(value: str, content_hash: str, computed: ComputedProperties) -> StoredRow:
+    length, is_palindrome, unique_characters, words, freq = computed
+    created_at = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    return StoredRow(
+        id=content_hash,
+        value=value,
+        length=length,
+        is_palindrome=is_palindrome,
+        unique_characters=unique_characters,
+        word_count=words,
+        content_hash=content_hash,
+        hash_algorithm=HASH_ALGO,
+        character_frequency_map=freq,
+        created_at=created_at,
+    )
+
+# ----- Filtering -----
+# filters answered by PropertyColumns masks; contains_character and unfiltered
+# queries touch most rows anyway, so they always use the generated row scan
+# (make_scanner), whatever the db size
+COLUMN_FILTERS = ("is_palindrome", "min_length", "max_length", "word_count", "min_word_count")
+# below this many rows the row scan beats setting up numpy masks for any filter
+COLUMN_SCAN_MIN_ROWS = 512
+# integer filters must fit the int64 columns and orjson, which echoes them back
+MAX_FILTER_INT = 2 ** 63 - 1
+
+# filter -> condition on row `st`; the filter value is bound to a variable of the same name
+FILTER_CONDITIONS = {
+    "is_palindrome": "st.is_palindrome == is_palindrome",
+    "min_length": "st.length >= min_length",
+    "max_length": "st.length <= max_length",
+    "word_count": "st.word_count == word_count",
+    "min_word_count": "st.word_count >= min_word_count",
+    "contains_character": "contains_character in st.char_set",
+}
+
+@functools.lru_cache(maxsize=2 ** len(FILTER_CONDITIONS))
+def _scanner_factory(active: Tuple[str, ...]) -> Callable[..., Callable[[Iterable[StoredRow]], List[StoredRow]]]:
+    # Generates a scan loop containing only the conditions of the filters that
+    # are set, so no row pays for "is this filter set?" checks or a predicate
+    # call. Only fixed names reach the source; filter values are passed in.
+    condition = " and ".join(FILTER_CONDITIONS[name] for name in active) or "True"
+    src = (
+        f"def factory({', '.join(active)}):\n"
+        f"    def scan(rows):\n"
+        f"        return [st for st in rows if {condition}]\n"
+        f"    return scan\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(src, f"<scanner {','.join(active) or 'all'}>", "exec"), namespace)
+    return namespace["factory"]
+
+def make_scanner(filters: Dict[str, Any]) -> Callable[[Iterable[StoredRow]], List[StoredRow]]:
+    values = {name: filters[name] for name in FILTER_CONDITIONS if filters.get(name) is not None}
+    if "contains_character" in values:
+        values["contains_character"] = values["contains_character"].lower()
+    return _scanner_factory(tuple(values))(**values)
+
+def select_strings(filters: Dict[str, Any]) -> List[StoredRow]:
+    # all stored strings matching filters, in insertion order
+    if len(string_db) >= COLUMN_SCAN_MIN_ROWS and any(filters.get(name) is not None for name in COLUMN_FILTERS):
+        return property_columns.scan(filters)
+    return make_scanner(filters)(string_db.values())
+
+# ----- Responses -----
+# records serialized per chunk of a streamed list response
+STREAM_CHUNK_ROWS = 256
+
+def list_envelope(records: List[StoredRow], extra: Dict[str, Any], status_code: int = 200) -> Response:
+    # {"data": [...records], **extra} in a single orjson pass over the cached
+    # payloads; only for results bounded by the request itself
+    content = orjson.dumps({"data": [string_payloads[s.id] for s in records], **extra})
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+async def stream_envelope(payloads: List[orjson.Fragment], tail: bytes) -> AsyncIterator[bytes]:
+    # emits {"data": [...payloads], <tail> a chunk at a time instead of building it whole
+    yield b'{"data":['
+    for start in range(0, len(payloads), STREAM_CHUNK_ROWS):
+        chunk = orjson.dumps(payloads[start: start + STREAM_CHUNK_ROWS])[1:-1]
+        yield chunk if start == 0 else b"," + chunk
+    yield tail
+
+def streamed_list(records: List[StoredRow], extra: Dict[str, Any], status_code: int = 200) -> StreamingResponse:
+    # for unbounded results; grab the payloads now so a concurrent delete cannot break the stream
+    payloads = [string_payloads[s.id] for s in records]
+    # serialize the rest of the envelope before any headers go out, so a
+    # failure here is still an ordinary error response
+    tail = b"]," + orjson.dumps(extra)[1:]
+    return StreamingResponse(stream_envelope(payloads, tail), status_code=status_code, media_type="application/json")
+
+def json_payload(key: str, status_code: int = 200) -> Response:
+    return Response(content=orjson.dumps(string_payloads[key]), status_code=status_code, media_type="application/json")
+
 # ----- Endpoints -----
 
 @app.get("/", summary="API root")
 def root():
     return {
         "message": "String Analysis API",
-        "endpoints": ["/strings (POST, GET)", "/strings/{id_or_value} (GET, DELETE)", "/strings/filter-by-natural-language"]
+        "endpoints": ["/strings (POST, GET)", "/strings/batch (POST)", "/strings/{id_or_value} (GET, DELETE)", "/strings/filter-by-natural-language"]
     }
 
 @app.post("/strings", response_model=StoredString, status_code=201)
@@ -110,26 +540,87 @@ async def create_string(req: CreateRequest):
 
     value = req.value
     # check duplicates by exact string match
-    if any(stored.value == value for stored in string_db.values()):
+    if value in value_index:
         raise HTTPException(status_code=409, detail="String already exists in the system")
 
-    sha = generate_sha_256(value)
-    props = Properties(
-        length=len(value),
-        is_palindrome=palindrome(value),
-        unique_characters=unique_characters_count(value),
-        word_count=word_count(value),
-        sha256_hash=sha,
-        character_frequency_map=char_count(value),
-    )
-    created_at = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
-    stored = StoredString(id=sha, value=value, properties=props, created_at=created_at)
-    string_db[sha] = stored
+    stored = build_stored(value, generate_content_hash(value), compute_properties(value))
+    db_put(stored)
 
     # persist
-    save_db()
+    persist([put_record(stored)])
 
-    return stored
+    return json_payload(stored.id, status_code=201)
+
+@app.post("/strings/batch", status_code=201)
+async def create_strings_batch(req: BatchCreateRequest):
+    values = req.values
+    if not values:
+        raise HTTPException(status_code=400, detail="'values' must not be empty")
+    if len(set(values)) != len(values):
+        raise HTTPException(status_code=409, detail="Batch contains duplicate strings")
+
+    if any(value in value_index for value in values):
+        raise HTTPException(status_code=409, detail="String already exists in the system")
+
+    hashes = await generate_content_hash_batch(values)
+    # other requests may have run while the hashes were computed
+    if any(value in value_index for value in values):
+        raise HTTPException(status_code=409, detail="String already exists in the system")
+    created = [build_stored(value, h, compute_properties(value)) for value, h in zip(values, hashes)]
+    for stored in created:
+        db_put(stored)
+
+    # one log write for the whole batch
+    persist([put_record(stored) for stored in created])
+
+    return list_envelope(created, {"count": len(created)}, status_code=201)
+
+# declared before /strings/{id_or_value}: routes match in order, and the
+# parametrized route would otherwise capture this path
+@app.get("/strings/filter-by-natural-language", status_code=200)
+async def filter_by_natural_language(query: str = Query(..., min_length=1)):
+    if not query or not query.strip():
+        raise HTTPException(status_code=400, detail="query parameter required")
+
+    q = query.lower()
+    parsed = {"original": query, "parsed_filters": {}}
+
+    # heuristics
+    if "single word" in q or "single-word" in q:
+        parsed["parsed_filters"]["word_count"] = 1
+    if "more than one word" in q or "multiple words" in q:
+        parsed["parsed_filters"]["min_word_count"] = 2
+    if "palindrom" in q:  # catches palindromic / palindrome
+        parsed["parsed_filters"]["is_palindrome"] = True
+
+    m = _LONGER_THAN_RE.search(q)
+    if m:
+        min_length = int(m.group(1)) + 1
+        if min_length > MAX_FILTER_INT:
+            raise HTTPException(status_code=400, detail="Length in query is too large")
+        parsed["parsed_filters"]["min_length"] = min_length
+
+    m2 = _CONTAINS_RE.search(q)
+    if m2:
+        parsed["parsed_filters"]["contains_character"] = m2.group(1).lower()
+
+    if "first vowel" in q:
+        # heuristic: first vowel = 'a'
+        parsed["parsed_filters"]["contains_character"] = parsed["parsed_filters"].get("contains_character", "a")
+
+    if not parsed["parsed_filters"]:
+        raise HTTPException(status_code=400, detail="Unable to parse natural language query")
+
+    pf = parsed["parsed_filters"]
+    if "min_length" in pf and "max_length" in pf and pf["min_length"] > pf["max_length"]:
+        raise HTTPException(status_code=422, detail="Parsed filters conflict (min_length > max_length)")
+
+    results = select_strings(pf)
+
+    return streamed_list(results, {
+        "count": len(results),
+        "interpreted_query": parsed,
+    })
 
 @app.get("/strings/{id_or_value}", response_model=StoredString, status_code=200)
 async def get_string(id_or_value: str):
@@ -138,12 +629,12 @@ async def get_string(id_or_value: str):
 
     # 1. try treat as SHA key
     if identifier in string_db:
-        return string_db[identifier]
+        return json_payload(identifier)
 
     # 2. try find by exact value
-    for st in string_db.values():
-        if st.value == identifier:
-            return st
+    key = value_index.get(identifier)
+    if key is not None:
+        return json_payload(key)
 
     raise HTTPException(status_code=404, detail="String not found")
 
@@ -151,21 +642,11 @@ async def get_string(id_or_value: str):
 async def delete_string(id_or_value: str):
     identifier = unquote_plus(id_or_value)
 
-    # delete by SHA
-    if identifier in string_db:
-        del string_db[identifier]
-        save_db()
-        return None
-
-    # delete by value (first match)
-    found_key = None
-    for k, v in string_db.items():
-        if v.value == identifier:
-            found_key = k
-            break
-    if found_key:
-        del string_db[found_key]
-        save_db()
+    # delete by SHA, else by value
+    key = identifier if identifier in string_db else value_index.get(identifier)
+    if key is not None:
+        db_pop(key)
+        persist([delete_record(key)])
         return None
 
     raise HTTPException(status_code=404, detail="String not found")
@@ -173,9 +654,9 @@ async def delete_string(id_or_value: str):
 @app.get("/strings", status_code=200)
 async def list_strings(
     is_palindrome: Optional[bool] = Query(None),
-    min_length: Optional[int] = Query(None, ge=0),
-    max_length: Optional[int] = Query(None, ge=0),
-    word_count: Optional[int] = Query(None, ge=0),
+    min_length: Optional[int] = Query(None, ge=0, le=MAX_FILTER_INT),
+    max_length: Optional[int] = Query(None, ge=0, le=MAX_FILTER_INT),
+    word_count: Optional[int] = Query(None, ge=0, le=MAX_FILTER_INT),
     contains_character: Optional[str] = Query(None, min_length=1, max_length=1),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1),
@@ -194,85 +675,24 @@ async def list_strings(
         "contains_character": contains_character,
     }
 
-    def matches(st: StoredString) -> bool:
-        p = st.properties
-        if is_palindrome is not None and p.is_palindrome != is_palindrome:
-            return False
-        if min_length is not None and p.length < min_length:
-            return False
-        if max_length is not None and p.length > max_length:
-            return False
-        if word_count is not None and p.word_count != word_count:
-            return False
-        if contains_character is not None:
-            if contains_character.lower() not in p.character_frequency_map:
-                return False
-        return True
-
-    all_results = [s for s in string_db.values() if matches(s)]
+    all_results = select_strings(applied_filters)
     paginated = all_results[skip: skip + limit]
 
-    return {
-        "data": [s.dict() for s in paginated],
+    # limit is unbounded, so stream rather than build the body in memory
+    return streamed_list(paginated, {
         "count": len(all_results),
         "returned": len(paginated),
         "filters_applied": applied_filters,
-    }
-
-@app.get("/strings/filter-by-natural-language", status_code=200)
-async def filter_by_natural_language(query: str = Query(..., min_length=1)):
-    if not query or not query.strip():
-        raise HTTPException(status_code=400, detail="query parameter required")
-
-    q = query.lower()
-    parsed = {"original": query, "parsed_filters": {}}
-
-    # heuristics
-    if "single word" in q or "single-word" in q:
-        parsed["parsed_filters"]["word_count"] = 1
-    if "more than one word" in q or "multiple words" in q:
-        parsed["parsed_filters"]["min_word_count"] = 2
-    if "palindrom" in q:  # catches palindromic / palindrome
-        parsed["parsed_filters"]["is_palindrome"] = True
-
-    m = re.search(r"longer than (\d+)", q)
-    if m:
-        parsed["parsed_filters"]["min_length"] = int(m.group(1)) + 1
-
-    m2 = re.search(r"contain(?:s|ing)?(?: the letter)?\s+([a-zA-Z])", q)
-    if m2:
-        parsed["parsed_filters"]["contains_character"] = m2.group(1).lower()
-
-    if "first vowel" in q:
-        # heuristic: first vowel = 'a'
-        parsed["parsed_filters"]["contains_character"] = parsed["parsed_filters"].get("contains_character", "a")
-
-    if not parsed["parsed_filters"]:
-        raise HTTPException(status_code=400, detail="Unable to parse natural language query")
-
-    pf = parsed["parsed_filters"]
-    if "min_length" in pf and "max_length" in pf and pf["min_length"] > pf["max_length"]:
-        raise HTTPException(status_code=422, detail="Parsed filters conflict (min_length > max_length)")
-
-    def matches_parsed(st: StoredString) -> bool:
-        p = st.properties
-        if "is_palindrome" in pf and p.is_palindrome != pf["is_palindrome"]:
-            return False
-        if "min_length" in pf and p.length < pf["min_length"]:
-            return False
-        if "max_length" in pf and p.length > pf["max_length"]:
-            return False
-        if "word_count" in pf and p.word_count != pf["word_count"]:
-            return False
-        if "contains_character" in pf:
-            if pf["contains_character"].lower() not in p.character_frequency_map:
-                return False
-        return True
-
-    results = [s for s in string_db.values() if matches_parsed(s)]
-
-    return {
-        "data": [s.dict() for s in results],
-        "count": len(results),
-        "interpreted_query": parsed,
-    }
+    })
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop has no Windows build; uvicorn's default asyncio loop is used there.
+    # Always one worker: string_db lives in this process, and the persist
+    # writer assumes it is the only owner of DB_FILE/WAL_FILE.
+    uvicorn.run(
+        app,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
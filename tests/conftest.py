@@ -0,0 +1,13 @@
+import pytest
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def empty_db(monkeypatch, tmp_path):
+    # every test starts from an empty store; files land in tmp_path
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "string_db", {})
+    monkeypatch.setattr(main, "value_index", {})
+    monkeypatch.setattr(main, "string_payloads", {})
+    monkeypatch.setattr(main, "property_columns", main.PropertyColumns())
@@ -0,0 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as c:
+        yield c
+
+
+def test_list_strings_rejects_out_of_range_ints(client):
+    client.post("/strings", json={"value": "hello"})
+    for param in ("min_length", "max_length", "word_count"):
+        r = client.get("/strings", params={param: 10 ** 30})
+        assert r.status_code == 422
+        orjson.loads(r.content)
+
+    r = client.get("/strings", params={"max_length": main.MAX_FILTER_INT})
+    assert r.status_code == 200
+    assert orjson.loads(r.content)["count"] == 1
+
+
+def test_natural_language_rejects_oversized_length(client):
+    r = client.get("/strings/filter-by-natural-language",
+                   params={"query": "strings longer than 99999999999999999999999"})
+    assert r.status_code == 400
+    orjson.loads(r.content)
+
+
+def test_streamed_list_fails_before_sending():
+    with pytest.raises(TypeError):
+        main.streamed_list([], {"count": 10 ** 30})
+
+
+def test_batch_rejects_duplicates_within_batch(client):
+    r = client.post("/strings/batch", json={"values": ["a", "b", "a"]})
+    assert r.status_code == 409
+    assert main.string_db == {}
+
+
+def test_batch_rechecks_duplicates_after_hashing(client, monkeypatch):
+    hash_batch = main.generate_content_hash_batch
+
+    async def racing_hash_batch(values):
+        hashes = await hash_batch(values)
+        # another request stores one of the values while this one is hashing
+        value = values[1]
+        main.db_put(main.build_stored(value, main.generate_content_hash(value), main.compute_properties(value)))
+        return hashes
+
+    monkeypatch.setattr(main, "generate_content_hash_batch", racing_hash_batch)
+    r = client.post("/strings/batch", json={"values": ["x", "y", "z"]})
+    assert r.status_code == 409
+    assert set(main.value_index) == {"y"}
+
+
+def test_batch_hashes_large_values_on_pool(client, monkeypatch):
+    submitted = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(args[0])
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(main, "_hash_executor", RecordingExecutor(max_workers=4))
+    large = [f"{i:04d}" * (main.HASH_GIL_MIN_BYTES // 4) for i in range(main.BATCH_HASH_MIN_BYTES // main.HASH_GIL_MIN_BYTES + 1)]
+    values = large + ["small"]
+
+    r = client.post("/strings/batch", json={"values": values})
+    assert r.status_code == 201
+    assert submitted == large
+    data = orjson.loads(r.content)["data"]
+    assert [d["id"] for d in data] == [main.generate_content_hash(v) for v in values]
@@ -0,0 +1,108 @@
+import itertools
+import random
+
+import pytest
+
+import main
+
+WORDS = ["abba", "racecar", "hello", "zz", "x", "noon", "Level", "abc de", "A b A", "q"]
+
+FILTER_OPTIONS = {
+    "is_palindrome": [None, True, False],
+    "min_length": [None, 3, 10],
+    "max_length": [None, 5, 12],
+    "word_count": [None, 1, 2],
+    "min_word_count": [None, 2],
+    "contains_character": [None, "a", "Z", "é"],
+}
+
+
+def put(value):
+    main.db_put(main.build_stored(value, main.generate_content_hash(value), main.compute_properties(value)))
+
+
+def random_values(n, seed=1):
+    rng = random.Random(seed)
+    values = set()
+    while len(values) < n:
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3)))
+        values.add(words + rng.choice(["", "", "!", str(rng.randint(0, 99))]))
+    return sorted(values)
+
+
+def reference(filters):
+    def ok(st):
+        f = filters
+        return (
+            (f["is_palindrome"] is None or st.is_palindrome == f["is_palindrome"])
+            and (f["min_length"] is None or st.length >= f["min_length"])
+            and (f["max_length"] is None or st.length <= f["max_length"])
+            and (f["word_count"] is None or st.word_count == f["word_count"])
+            and (f["min_word_count"] is None or st.word_count >= f["min_word_count"])
+            and (f["contains_character"] is None
+                 or f["contains_character"].lower() in st.character_frequency_map)
+        )
+    return [st.id for st in main.string_db.values() if ok(st)]
+
+
+def assert_matches_reference():
+    for combo in itertools.product(*FILTER_OPTIONS.values()):
+        filters = dict(zip(FILTER_OPTIONS, combo))
+        assert [st.id for st in main.select_strings(filters)] == reference(filters), filters
+
+
+@pytest.mark.parametrize("column_scan_min_rows", [0, 10 ** 9])
+def test_select_strings_matches_reference_after_deletes(monkeypatch, column_scan_min_rows):
+    monkeypatch.setattr(main, "COLUMN_SCAN_MIN_ROWS", column_scan_min_rows)
+    values = random_values(3000)
+    for value in values:
+        put(value)
+    for value in random.Random(2).sample(values, 500):
+        main.db_pop(main.value_index[value])
+
+    assert main.property_columns.dead == 500
+    assert_matches_reference()
+
+
+def test_select_strings_matches_reference_after_compaction(monkeypatch):
+    monkeypatch.setattr(main, "COLUMN_SCAN_MIN_ROWS", 0)
+    values = random_values(3000)
+    for value in values:
+        put(value)
+    for value in random.Random(3).sample(values, 2000):
+        main.db_pop(main.value_index[value])
+
+    columns = main.property_columns
+    assert columns.dead < 2000  # compacted at least once
+    assert len(columns.rows) == len(columns.row_of) + columns.dead
+    assert_matches_reference()
+
+    # rows appended after a compaction land after the survivors
+    for value in ["zz after", "noon after"]:
+        put(value)
+    assert [st.value for st in main.select_strings({"min_word_count": 2})][-2:] == ["zz after", "noon after"]
+    assert_matches_reference()
+
+
+def test_overwrite_keeps_insertion_position(monkeypatch):
+    monkeypatch.setattr(main, "COLUMN_SCAN_MIN_ROWS", 0)
+    for value in ["abba", "hello", "noon"]:
+        put(value)
+    put("abba")
+
+    assert [st.value for st in main.select_strings({"is_palindrome": True})] == ["abba", "noon"]
+    assert len(main.property_columns.rows) == 3
+
+
+@pytest.mark.parametrize("filters", [{}, {"contains_character": "A"}])
+def test_row_scan_handles_non_column_filters_on_large_dbs(monkeypatch, filters):
+    monkeypatch.setattr(main, "COLUMN_SCAN_MIN_ROWS", 0)
+    for value in ["abba", "hello", "noon"]:
+        put(value)
+
+    def no_column_scan(filters):
+        raise AssertionError("column scan used")
+
+    monkeypatch.setattr(main.property_columns, "scan", no_column_scan)
+    expected = ["abba", "hello", "noon"] if not filters else ["abba"]
+    assert [st.value for st in main.select_strings(filters)] == expected
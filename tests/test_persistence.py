@@ -0,0 +1,120 @@
+import asyncio
+import random
+
+import orjson
+import pytest
+
+import main
+
+
+def put(value):
+    stored = main.build_stored(value, main.generate_content_hash(value), main.compute_properties(value))
+    main.db_put(stored)
+    return stored
+
+
+def reload(monkeypatch):
+    # what a restarted process would see on disk
+    monkeypatch.setattr(main, "string_db", {})
+    monkeypatch.setattr(main, "value_index", {})
+    monkeypatch.setattr(main, "string_payloads", {})
+    monkeypatch.setattr(main, "property_columns", main.PropertyColumns())
+    main.load_db()
+    return {k: orjson.loads(orjson.dumps(v)) for k, v in main.string_payloads.items()}
+
+
+def write_wal(records, tail=b""):
+    with open(main.WAL_FILE, "wb") as f:
+        f.write(b"".join(orjson.dumps(r) + b"\n" for r in records) + tail)
+
+
+def test_replays_puts_and_deletes(monkeypatch):
+    kept, dropped = put("kept"), put("dropped")
+    write_wal([main.put_record(kept), main.put_record(dropped), main.delete_record(dropped.id)])
+
+    db = reload(monkeypatch)
+    assert list(db) == [kept.id]
+    assert db[kept.id] == kept.to_dict()
+    assert main.value_index == {"kept": kept.id}
+    assert main.property_columns.scan({"min_length": 1}) == [main.string_db[kept.id]]
+
+
+def test_torn_final_line_is_ignored(monkeypatch):
+    first, second = put("first"), put("second")
+    torn = orjson.dumps(main.put_record(second))[:-7]
+    write_wal([main.put_record(first)], tail=torn)
+
+    assert list(reload(monkeypatch)) == [first.id]
+
+
+def test_migrates_legacy_sha256_hash(monkeypatch):
+    row = put("legacy").to_dict()
+    props = row["properties"]
+    props["sha256_hash"] = props.pop("content_hash")
+    del props["hash_algorithm"]
+    with open(main.DB_FILE, "wb") as f:
+        f.write(orjson.dumps({row["id"]: row}))
+
+    db = reload(monkeypatch)
+    assert db[row["id"]]["properties"]["content_hash"] == props["sha256_hash"]
+    assert db[row["id"]]["properties"]["hash_algorithm"] == "sha256"
+    assert "sha256_hash" not in db[row["id"]]["properties"]
+
+
+def test_snapshot_while_records_queued(monkeypatch):
+    # snapshot after every write, so most snapshots are taken with newer
+    # mutations already applied in memory but not yet logged
+    monkeypatch.setattr(main, "SNAPSHOT_EVERY_OPS", 1)
+    snapshots = []
+    save_db = main.save_db
+
+    def counting_save_db(payloads=None):
+        if payloads is not None:
+            # taken by persist_writer; note how much was still waiting to be logged
+            snapshots.append(main.app.state.persist_queue.qsize())
+        save_db(payloads)
+
+    monkeypatch.setattr(main, "save_db", counting_save_db)
+
+    async def run():
+        await main.on_startup()
+        rng = random.Random(5)
+        try:
+            for i in range(300):
+                if main.string_db and rng.random() < 0.4:
+                    key = rng.choice(list(main.string_db))
+                    main.db_pop(key)
+                    main.persist([main.delete_record(key)])
+                else:
+                    stored = put(f"value {rng.randint(0, 150)}")
+                    main.persist([main.put_record(stored)])
+                if i % 3 == 0:
+                    await asyncio.sleep(0)
+            expected = {k: orjson.loads(orjson.dumps(v)) for k, v in main.string_payloads.items()}
+            # drain the writer but skip on_shutdown's final snapshot, as in a crash
+            main.app.state.persist_queue.put_nowait(None)
+            await main.app.state.persist_task
+        finally:
+            main.app.state.wal.close()
+        return expected
+
+    expected = asyncio.run(run())
+    assert any(snapshots)
+    assert reload(monkeypatch) == expected
+
+
+def test_corrupt_snapshot_refuses_to_start():
+    snapshot = b'{"abc": {"id": "abc", "val'
+    with open(main.DB_FILE, "wb") as f:
+        f.write(snapshot)
+    write_wal([main.delete_record("abc")])
+    with open(main.WAL_FILE, "rb") as f:
+        wal = f.read()
+
+    with pytest.raises(RuntimeError, match="Cannot load snapshot"):
+        asyncio.run(main.on_startup())
+
+    with open(main.DB_FILE, "rb") as f:
+        assert f.read() == snapshot
+    with open(main.WAL_FILE, "rb") as f:
+        assert f.read() == wal